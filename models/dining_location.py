@@ -1,105 +1,100 @@
-from __future__ import annotations
-
-from typing import Optional
+from functools import cache
+from typing import Annotated, List, Optional
 from uuid import UUID, uuid4
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from utils.clock import created_at_or_now, now_utc
+
+# Example payloads are built once at import and shared by every model below;
+# the public ones are also reused by models/meal_plan.py
+_DINING_LOCATION_ID_EXAMPLE = "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb"
+_NAME_EXAMPLE = "Grace Dodge"
+_CAPACITY_EXAMPLE = 200
+CREATED_AT_EXAMPLE = datetime(2025, 1, 15, 10, 20, 30, tzinfo=timezone.utc)
+UPDATED_AT_EXAMPLE = datetime(2025, 1, 16, 12, 0, 0, tzinfo=timezone.utc)
+
+DINING_LOCATION_EXAMPLE = {
+    "dining_location_id": _DINING_LOCATION_ID_EXAMPLE,
+    "name": _NAME_EXAMPLE,
+    "capacity": _CAPACITY_EXAMPLE,
+}
+_DINING_EXAMPLES = [DINING_LOCATION_EXAMPLE]
+
+_DINING_UPDATE_EXAMPLES = [
+    {
+        "name": _NAME_EXAMPLE,
+        "capacity": _CAPACITY_EXAMPLE,
+    },
+    {"capacity": 500},
+]
+
+# Model configs shared by each class hierarchy (Create/Read inherit the Base one)
+_DINING_BASE_CONFIG = ConfigDict(
+    extra="forbid",
+    json_schema_extra={"examples": _DINING_EXAMPLES},
+)
+_DINING_UPDATE_CONFIG = ConfigDict(
+    extra="forbid",
+    json_schema_extra={"examples": _DINING_UPDATE_EXAMPLES},
+)
+
+# Field settings shared by the Base and Update models
+_NAME_KW = dict(description="Dining Location name.", examples=[_NAME_EXAMPLE])
+_CAPACITY_KW = dict(description="Dining Location capacity.", strict=True, examples=[_CAPACITY_EXAMPLE])
 
 
 class DiningLocationBase(BaseModel):
     dining_location_id: UUID = Field(
         default_factory=uuid4,
         description="Persistent Dining Location ID (server-generated).",
-        json_schema_extra={"example": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb"},
-    )
-    name: str = Field(
-        ...,
-        description="Dining Location name.",
-        json_schema_extra={"example": "Grace Dodge"},
+        examples=[_DINING_LOCATION_ID_EXAMPLE],
     )
-    capacity: int = Field(
-        ...,
-        description="Dining Location capacity.",
-        json_schema_extra={"example": "200"},
-    )
-
+    name: str = Field(..., **_NAME_KW)
+    capacity: int = Field(..., **_CAPACITY_KW)
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                    "name": "Grace Dodge",
-                    "capacity": "200",
-                }
-            ]
-        }
-    }
+    model_config = _DINING_BASE_CONFIG
 
 
 class DiningLocationCreate(DiningLocationBase):
     """Creation payload; ID is generated server-side but present in the base model."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                    "name": "Grace Dodge",
-                    "capacity": "200",
-                }
-            ]
-        }
-    }
 
 
 class DiningLocationUpdate(BaseModel):
     """Partial update; Dining Location ID is taken from the path, not the body."""
-    name: Optional[str] = Field(
-        None,
-        description="Dining Location name.",
-        json_schema_extra={"example": "Grace Dodge"},
-    )
-    capacity: Optional[int] = Field(
-        None,
-        description="Dining Location capacity.",
-        json_schema_extra={"example": "200"},
-    )
+    name: Annotated[Optional[str], Field(**_NAME_KW)] = None
+    capacity: Annotated[Optional[int], Field(**_CAPACITY_KW)] = None
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "Grace Dodge",
-                    "capacity": "200",
-                },
-                {"capacity": "500"},
-            ]
-        }
-    }
+    model_config = _DINING_UPDATE_CONFIG
 
 
 class DiningLocationRead(DiningLocationBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=now_utc,
         description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-15T10:20:30Z"},
+        examples=[CREATED_AT_EXAMPLE],
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=created_at_or_now,
         description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-16T12:00:00Z"},
+        examples=[UPDATED_AT_EXAMPLE],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                    "name": "Grace Dodge",
-                    "capacity": "200",
-                    "created_at": "2025-08-15T10:20:30Z",
-                    "updated_at": "2025-08-16T12:00:00Z",
-                }
-            ]
-        }
-    }
\ No newline at end of file
+    @classmethod
+    def from_trusted(cls, **data) -> "DiningLocationRead":
+        """Build from already-validated data (e.g. a stored record) without re-validating it.
+
+        Nested values are kept as given, so pass model instances rather than dicts.
+        """
+        return cls.model_construct(**data)
+
+
+@cache
+def dining_location_list_adapter() -> TypeAdapter[List[DiningLocationBase]]:
+    """Bulk-validation entry point for arrays of dining locations.
+
+    Use ``dining_location_list_adapter().validate_python(items)`` instead of
+    calling ``DiningLocationBase.model_validate`` per element; the whole list
+    is validated in one call. The adapter is built on first use and reused.
+    """
+    return TypeAdapter(List[DiningLocationBase])
@@ -1,169 +1,108 @@
-from __future__ import annotations
-
-from typing import Optional, List, Annotated
+from typing import Optional, List, Tuple, Annotated
 from uuid import UUID, uuid4
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_jsonable_python
+
+from utils.clock import created_at_or_now, now_utc
+
+from .dining_location import (
+    DiningLocationBase,
+    CREATED_AT_EXAMPLE,
+    DINING_LOCATION_EXAMPLE,
+    UPDATED_AT_EXAMPLE,
+)
+
+# Example payloads are built once at import and shared by every model below.
+# Field examples hold real datetimes (pydantic serializes them); the
+# whole-object examples below are raw JSON, so they are serialized the same way here.
+_MEAL_PLAN_ID_EXAMPLE = "550e8400-e29b-41d4-a716-446655440000"
+_NAME_EXAMPLE = "Unlimited 7 day"
+_TYPE_EXAMPLE = "swipes"
+_COST_EXAMPLE = 1000.0
+_START_DATE_EXAMPLE = datetime(2025, 9, 14, tzinfo=timezone.utc)
+_END_DATE_EXAMPLE = datetime(2026, 9, 14, tzinfo=timezone.utc)
+_DINING_LOCATIONS_EXAMPLE = [DINING_LOCATION_EXAMPLE]
+_ID_EXAMPLE = "99999999-9999-4999-8999-999999999999"
+
+_MEAL_PLAN_EXAMPLE = {
+    "meal_plan_id": _MEAL_PLAN_ID_EXAMPLE,
+    "name": _NAME_EXAMPLE,
+    "type": _TYPE_EXAMPLE,
+    "cost": _COST_EXAMPLE,
+    "start_date": to_jsonable_python(_START_DATE_EXAMPLE),
+    "end_date": to_jsonable_python(_END_DATE_EXAMPLE),
+    "dining_locations": _DINING_LOCATIONS_EXAMPLE,
+}
+_MEAL_PLAN_EXAMPLES = [_MEAL_PLAN_EXAMPLE]
+
+_MEAL_PLAN_UPDATE_EXAMPLES = [
+    {k: v for k, v in _MEAL_PLAN_EXAMPLE.items() if k != "meal_plan_id"},
+    {"cost": 500.0},
+]
+
+# Model configs shared by each class hierarchy (Create/Read inherit the Base one)
+_MEAL_PLAN_BASE_CONFIG = ConfigDict(
+    extra="forbid",
+    json_schema_extra={"examples": _MEAL_PLAN_EXAMPLES},
+)
+_MEAL_PLAN_UPDATE_CONFIG = ConfigDict(
+    extra="forbid",
+    json_schema_extra={"examples": _MEAL_PLAN_UPDATE_EXAMPLES},
+)
+
+# Columbia has ~20 dining halls; anything far beyond that is malformed input
+_MAX_DINING_LOCATIONS = 64
+
+# Field settings shared by the Base, Update and Read models
+_NAME_KW = dict(description="Meal Plan name.", examples=[_NAME_EXAMPLE])
+_TYPE_KW = dict(description="Meal Plan type.", examples=[_TYPE_EXAMPLE])
+_COST_KW = dict(description="Cost of meal plan in USD.", strict=True, examples=[_COST_EXAMPLE])
+_START_DATE_KW = dict(description="Meal plan official start date.", examples=[_START_DATE_EXAMPLE])
+_END_DATE_KW = dict(description="Meal plan official end date.", examples=[_END_DATE_EXAMPLE])
+_DINING_LOCATIONS_KW = dict(
+    description="Dining Location linked to this meal plan (each carries a persistent Dining Location ID).",
+    max_length=_MAX_DINING_LOCATIONS,
+    examples=[_DINING_LOCATIONS_EXAMPLE],
+)
 
-from .dining_location import DiningLocationBase
 
 class MealPlanBase(BaseModel):
     meal_plan_id: UUID = Field(
         default_factory=uuid4,
         description="Persistent meal plan ID (server-generated).",
-        json_schema_extra={"example": "550e8400-e29b-41d4-a716-446655440000"},
-    )
-    name: str = Field(
-        ...,
-        description="Meal Plan name.",
-        json_schema_extra={"example": "Unlimited 7 day"},
-    )
-    type: str = Field(
-        ...,
-        description="Meal Plan type.",
-        json_schema_extra={"example": "swipes"},
-    )
-    cost: float = Field(
-        ...,
-        description="Cost of meal plan in USD.",
-        json_schema_extra={"example": "1000"},
-    )
-    start_date: Optional[datetime] = Field(
-        None,
-        description="Meal plan official start date.",
-        json_schema_extra={"example": "2025-09-14T00:00:00Z"},
-    )
-    end_date: Optional[datetime] = Field(
-        None,
-        description="Meal plan official end date.",
-        json_schema_extra={"example": "2026-09-14T00:00:00Z"},
+        examples=[_MEAL_PLAN_ID_EXAMPLE],
     )
+    name: str = Field(..., **_NAME_KW)
+    type: str = Field(..., **_TYPE_KW)
+    cost: float = Field(..., **_COST_KW)
+    start_date: Optional[datetime] = Field(None, **_START_DATE_KW)
+    end_date: Optional[datetime] = Field(None, **_END_DATE_KW)
     
     # Embed dining location (each with persistent ID)
-    dining_locations: List[DiningLocationBase] = Field(
-        default_factory=list,
-        description="Dining Location linked to this meal plan (each carries a persistent Dining Location ID).",
-        json_schema_extra={
-            "example": [
-                {
-                    "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                    "name": "Grace Dodge",
-                    "capacity": "200",
-                }
-            ]
-        },
-    )
+    dining_locations: List[DiningLocationBase] = Field(default_factory=list, **_DINING_LOCATIONS_KW)
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "meal_plan_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "name": "Unlimited 7 day",
-                    "type": "swipes",
-                    "cost": "1000",
-                    "start_date": "2025-09-14T00:00:00Z",
-                    "end_date": "2026-09-14T00:00:00Z",
-                    "dining_locations": [
-                        {
-                            "dining_location_id": "550e8400-e29b-41d4-a716-446655440000",
-                            "name": "Grace Dodge",
-                            "capacity": "200",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
+    model_config = _MEAL_PLAN_BASE_CONFIG
 
 
 class MealPlanCreate(MealPlanBase):
     """Creation payload; ID is generated server-side but present in the base model."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "meal_plan_id": "11111111-1111-4111-8111-111111111111",
-                    "name": "Unlimited 5 day",
-                    "type": "swipes",
-                    "cost": "800",
-                    "start_date": "2025-08-15T00:00:00Z",
-                    "end_date": "2026-08-15T00:00:00Z",
-                    "dining_locations": [
-                        {
-                            "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                            "name": "Grace Dodge",
-                            "capacity": "200",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
 
 
 class MealPlanUpdate(BaseModel):
     """Partial update; meal plan ID is taken from the path, not the body."""
-    name: Optional[str] = Field(
-        None,
-        description="Meal Plan name.",
-        json_schema_extra={"example": "Unlimited 7 day"},
-    )
-    type: Optional[str] = Field(
-        None,
-        description="Meal Plan type.",
-        json_schema_extra={"example": "swipes"},
-    )
-    cost: Optional[float] = Field(
-        None,
-        description="Cost of meal plan in USD.",
-        json_schema_extra={"example": "1000"},
-    )
-    start_date: Optional[datetime] = Field(
-        None,
-        description="Meal plan official start date.",
-        json_schema_extra={"example": "09/14/2025"},
-    )
-    end_date: Optional[datetime] = Field(
-        None,
-        description="Meal plan official end date.",
-        json_schema_extra={"example": "09/14/2026"},
-    )
-    dining_locations: Optional[List[DiningLocationBase]] = Field(
-        None,
+    name: Annotated[Optional[str], Field(**_NAME_KW)] = None
+    type: Annotated[Optional[str], Field(**_TYPE_KW)] = None
+    cost: Annotated[Optional[float], Field(**_COST_KW)] = None
+    start_date: Annotated[Optional[datetime], Field(**_START_DATE_KW)] = None
+    end_date: Annotated[Optional[datetime], Field(**_END_DATE_KW)] = None
+    dining_locations: Annotated[Optional[List[DiningLocationBase]], Field(
         description="Replace the entire set of dining locations with this list.",
-        json_schema_extra={
-            "example": [
-                {
-                        "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                        "name": "Grace Dodge",
-                        "capacity": "200",
-                }
-            ]
-        },
-    )
+        max_length=_MAX_DINING_LOCATIONS,
+        examples=[_DINING_LOCATIONS_EXAMPLE],
+    )] = None
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                  "name": "Unlimited 5 day",
-                  "type": "swipes",
-                  "cost": "800",
-                  "start_date": "2025-08-15T00:00:00Z",
-                  "end_date": "2026-08-15T00:00:00Z",
-                    "dining_locations": [
-                        {
-                            "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                            "name": "Grace Dodge",
-                            "capacity": "200",
-                        }
-                    ],
-                },
-                {"cost": "500"},
-            ]
-        }
-    }
+    model_config = _MEAL_PLAN_UPDATE_CONFIG
 
 
 class MealPlanRead(MealPlanBase):
@@ -171,39 +110,26 @@ class MealPlanRead(MealPlanBase):
     id: UUID = Field(
         default_factory=uuid4,
         description="Server-generated Person ID.",
-        json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
+        examples=[_ID_EXAMPLE],
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=now_utc,
         description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-15T10:20:30Z"},
+        examples=[CREATED_AT_EXAMPLE],
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=created_at_or_now,
         description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-16T12:00:00Z"},
+        examples=[UPDATED_AT_EXAMPLE],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "meal_plan_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "name": "Unlimited 7 day",
-                    "type": "swipes",
-                    "cost": "1000",
-                    "start_date": "2025-08-15T00:00:00Z",
-                    "end_date": "2026-08-15T00:00:00Z",
-                    "dining_locations": [
-                        {
-                            "dining_location_id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                            "name": "Grace Dodge",
-                            "capacity": "200",
-                        }
-                    ],
-                    "created_at": "2025-08-15T10:20:30Z",
-                    "updated_at": "2025-08-16T12:00:00Z",
-                }
-            ]
-        }
-    }
\ No newline at end of file
+    # Read models are never mutated in place, so the embedded locations are a tuple
+    dining_locations: Tuple[DiningLocationBase, ...] = Field(default_factory=tuple, **_DINING_LOCATIONS_KW)
+
+    @classmethod
+    def from_trusted(cls, **data) -> "MealPlanRead":
+        """Build from already-validated data (e.g. a stored record) without re-validating it.
+
+        Nested values are kept as given, so pass model instances rather than dicts.
+        """
+        return cls.model_construct(**data)
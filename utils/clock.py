@@ -0,0 +1,16 @@
+from typing import Any, Dict
+from datetime import datetime, timezone
+
+
+def now_utc() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow()."""
+    return datetime.now(timezone.utc)
+
+
+def created_at_or_now(data: Dict[str, Any]) -> datetime:
+    """Default for updated_at: reuse the validated created_at object.
+
+    Falls back to now_utc() when created_at is missing from ``data`` because it
+    failed validation (the model then raises a ValidationError anyway).
+    """
+    return data.get("created_at") or now_utc()